@@ -1,10 +1,14 @@
 import pymem
 import pymem.process
+import ctypes
+import ctypes.wintypes
 import logging
-import time
-from typing import Any, Dict, Optional, List, Tuple
-from dataclasses import dataclass
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, List, Tuple
 from enum import Enum
+import numpy as np
+from numba import njit
 import pygame
 import math
 
@@ -17,8 +21,16 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 GAME_EXE = "EvilWithin.exe"
 ENTITY_LIST_BASE_OFFSET = 0x01E7AF20
 POINTER_SPACING = 0x18
+POINTER_TABLE_STRIDE = POINTER_SPACING // 8  # Entity pointer slots in qwords
 MAX_ENTITIES = 100  # Increased to catch more entities
 
+# The game may keep an entity count next to the list pointer. The bytes within this range
+# of it are read together with the pointer itself, and an integer that matches the scanned
+# slot count for enough consecutive frames (including at least one change of that count)
+# is used instead of the end-of-list heuristic, which also lets the pointer table read shrink.
+ENTITY_COUNT_PROBE_RANGE = 0x10
+ENTITY_COUNT_CONFIRM_FRAMES = 60
+
 # Radar configuration
 RADAR_CONFIG = {
     "default_range": 1000,
@@ -31,6 +43,12 @@ RADAR_CONFIG = {
     "show_info_panel": False,  # Set to False to hide text overlay
 }
 
+# Number of pre-rendered alert ring sizes used for the pulsing effect
+ALERT_PULSE_PHASES = 8
+
+# Maximum number of rendered info panel lines kept around
+TEXT_CACHE_SIZE = 256
+
 # Colors
 COLORS = {
     "background": (20, 20, 30),
@@ -57,11 +75,55 @@ ENTITY_FIELD_CONFIG = {
     "alertness": {"offset": 0xF44, "type": "short"},
 }
 
+# String field offsets, resolved once so the read path doesn't go through the config dict
+CLASS_NAME_POINTER_OFFSET = ENTITY_FIELD_CONFIG["class_name"]["pointer_offset"]
+CLASS_NAME_VALUE_OFFSET = ENTITY_FIELD_CONFIG["class_name"]["value_offset"]
+INSTANCE_NAME_POINTER_OFFSET = ENTITY_FIELD_CONFIG["instance_name"]["pointer_offset"]
+INSTANCE_NAME_VALUE_OFFSET = ENTITY_FIELD_CONFIG["instance_name"]["value_offset"]
+
+# Numeric entity fields live in one contiguous block (x at 0x6C8 .. alertness at 0xF44),
+# so they are fetched with a single ReadProcessMemory call (see EntityBlock).
+ENTITY_NUMERIC_TYPES = {"float": ctypes.c_float, "short": ctypes.c_short}
+ENTITY_BLOCK_OFFSET = min(config["offset"] for config in ENTITY_FIELD_CONFIG.values()
+                          if "offset" in config)
+
+_kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_kernel32.ReadProcessMemory.argtypes = [
+    ctypes.wintypes.HANDLE,
+    ctypes.wintypes.LPCVOID,
+    ctypes.wintypes.LPVOID,
+    ctypes.c_size_t,
+    ctypes.POINTER(ctypes.c_size_t),
+]
+_kernel32.ReadProcessMemory.restype = ctypes.wintypes.BOOL
+
 
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
+def _entity_block_fields(field_config: dict) -> List[Tuple[str, type]]:
+    """Build the EntityBlock layout from the direct-offset fields, padding the gaps"""
+    numeric = sorted((config["offset"], name, ENTITY_NUMERIC_TYPES[config["type"]])
+                     for name, config in field_config.items() if "offset" in config)
+    fields = []
+    cursor = ENTITY_BLOCK_OFFSET
+    for offset, name, c_type in numeric:
+        if offset < cursor:
+            raise ValueError(f"Entity field '{name}' at 0x{offset:X} overlaps the previous field")
+        if offset > cursor:
+            fields.append((f"_pad_{cursor:X}", ctypes.c_ubyte * (offset - cursor)))
+        fields.append((name, c_type))
+        cursor = offset + ctypes.sizeof(c_type)
+    return fields
+
+
+class EntityBlock(ctypes.Structure):
+    """Raw layout of the numeric entity fields, starting at ENTITY_BLOCK_OFFSET"""
+    _pack_ = 1
+    _fields_ = _entity_block_fields(ENTITY_FIELD_CONFIG)
+
+
 class EntityType(Enum):
     PLAYER = "player"
     ENEMY = "enemy"
@@ -70,20 +132,21 @@ class EntityType(Enum):
     OBJECT = "object"
 
 
-@dataclass
 class Position:
-    x: float
-    y: float
-    z: float = 0.0
+    __slots__ = ("x", "y", "z")
 
-    def distance_to(self, other: 'Position') -> float:
-        return math.hypot(self.x - other.x, self.y - other.y)
+    def __init__(self, x: float, y: float, z: float = 0.0):
+        self.x = x
+        self.y = y
+        self.z = z
 
 
-@dataclass
 class Rotation:
-    cos_theta: float
-    sin_theta: float
+    __slots__ = ("cos_theta", "sin_theta")
+
+    def __init__(self, cos_theta: float, sin_theta: float):
+        self.cos_theta = cos_theta
+        self.sin_theta = sin_theta
 
     @property
     def angle_degrees(self) -> float:
@@ -133,16 +196,21 @@ class Rotation:
         return self.to_radar_space(world_dir_x, world_dir_y)
 
 
-@dataclass
 class Entity:
-    address: int
-    position: Position
-    entity_type: EntityType
-    health: float = 0.0
-    class_name: str = ""
-    instance_name: str = ""
-    rotation: Optional[Rotation] = None
-    alertness: Optional[int] = None  # -1 = not alerted, 0 = alerted
+    __slots__ = ("address", "position", "entity_type", "health", "class_name",
+                 "instance_name", "rotation", "alertness")
+
+    def __init__(self, address: int, position: Position, entity_type: EntityType,
+                 health: float = 0.0, class_name: str = "", instance_name: str = "",
+                 rotation: Optional[Rotation] = None, alertness: Optional[int] = None):
+        self.address = address
+        self.position = position
+        self.entity_type = entity_type
+        self.health = health
+        self.class_name = class_name
+        self.instance_name = instance_name
+        self.rotation = rotation
+        self.alertness = alertness  # -1 = not alerted, 0 = alerted
 
     def is_valid_position(self) -> bool:
         """Check if entity has reasonable world coordinates"""
@@ -169,6 +237,36 @@ class GameMemoryReader:
         self.pm = self._attach_to_process(game_exe)
         self.module_base = self._get_module_base(game_exe)
         self.entity_list_pointer = self.module_base + ENTITY_LIST_BASE_OFFSET
+        # Field blocks for every entity in the frame, filled in order by one worker job
+        # while the main thread parses the blocks that are already in (see _prefetch_blocks)
+        self._blocks = (EntityBlock * MAX_ENTITIES)()
+        self._blocks_ok = [False] * MAX_ENTITIES
+        self._blocks_read = 0
+        self._blocks_ready = threading.Condition()
+        self._prefetch_cancelled = False
+        self._prefetcher = ThreadPoolExecutor(max_workers=1)
+        self._qword = ctypes.c_uint64()
+
+        # List pointer plus its neighbourhood, read in one call (see _read_list_header)
+        self._list_header = (ctypes.c_ubyte * (ENTITY_COUNT_PROBE_RANGE * 2 + 8))()
+        self._list_header_ok = False
+
+        # Entity count field discovery (see _probe_entity_count)
+        self._count_offset: Optional[int] = None  # Relative to entity_list_pointer, once confirmed
+        # Candidate offset -> [consecutive matching frames, last matched count, count changes followed]
+        self._count_matches: Dict[int, List[int]] = {}
+        self._rejected_count_offsets = set()
+        self._pointer_table = (ctypes.c_uint64 * (POINTER_TABLE_STRIDE * MAX_ENTITIES))()
+
+        # Struct-of-arrays copy of entity positions, index-aligned with read_all_entities()
+        self.xs = np.empty(MAX_ENTITIES, dtype=np.float32)
+        self.ys = np.empty(MAX_ENTITIES, dtype=np.float32)
+
+        # Entities from the previous frame, keyed by address. The same objects are
+        # updated in place each frame instead of allocating new ones.
+        self._entity_cache: Dict[int, Entity] = {}
+        # Name-based classification per entity address (see _classify_entity)
+        self._type_cache: Dict[int, EntityType] = {}
         logging.info(f"Entity list pointer: 0x{self.entity_list_pointer:X}")
 
     def _attach_to_process(self, game_exe: str) -> pymem.Pymem:
@@ -188,37 +286,138 @@ class GameMemoryReader:
         except Exception as e:
             raise MemoryReadError(f"Failed to get module base: {e}")
 
-    def _read_field(self, entity_address: int, config: dict) -> Optional[Any]:
-        """Read a single field from entity memory"""
+    def _read_qword(self, address: int) -> int:
+        """Read an unsigned 64-bit value (e.g. a pointer), returning 0 on failure"""
+        if not _kernel32.ReadProcessMemory(self.pm.process_handle, address,
+                                           ctypes.byref(self._qword), 8, None):
+            return 0
+        return self._qword.value
+
+    def _read_string(self, entity_address: int, pointer_offset: int, value_offset: int) -> str:
+        """Read a pointer-based string field from entity memory"""
         try:
-            # Handle pointer-based fields
-            if "pointer_offset" in config:
-                pointer_addr = self.pm.read_longlong(entity_address + config["pointer_offset"])
-                if not pointer_addr or pointer_addr < 0x10000:  # Basic validation
-                    return None
-                value_address = pointer_addr + config["value_offset"]
-            else:
-                value_address = entity_address + config["offset"]
-
-            # Read based on type
-            field_type = config["type"]
-            if field_type == "string":
-                return self.pm.read_string(value_address, byte=50)  # Limit string length
-            elif field_type == "float":
-                return self.pm.read_float(value_address)
-            elif field_type == "short":
-                return self.pm.read_short(value_address)
-            return None
+            pointer_addr = self._read_qword(entity_address + pointer_offset)
+            if not pointer_addr or pointer_addr < 0x10000:  # Basic validation
+                return ""
+            return self.pm.read_string(pointer_addr + value_offset, byte=50) or ""  # Limit string length
 
         except (pymem.exception.MemoryReadError, pymem.exception.WinAPIError):
-            return None
+            return ""
         except Exception as e:
-            logging.debug(f"Unexpected error reading field: {e}")
+            logging.debug(f"Unexpected error reading string field: {e}")
+            return ""
+
+    def _read_names(self, entity_address: int) -> Tuple[str, str]:
+        """Read the class and instance name of an entity"""
+        class_name = self._read_string(entity_address, CLASS_NAME_POINTER_OFFSET, CLASS_NAME_VALUE_OFFSET)
+        instance_name = self._read_string(entity_address, INSTANCE_NAME_POINTER_OFFSET,
+                                          INSTANCE_NAME_VALUE_OFFSET)
+        return class_name, instance_name
+
+    def _read_entity_block(self, entity_address: int, block: EntityBlock) -> bool:
+        """Read the numeric field block of an entity in one call"""
+        return bool(_kernel32.ReadProcessMemory(self.pm.process_handle,
+                                                entity_address + ENTITY_BLOCK_OFFSET,
+                                                ctypes.byref(block),
+                                                ctypes.sizeof(block), None))
+
+    def _prefetch_blocks(self, addresses: List[int]):
+        """Worker job: read the field block of each address into self._blocks, in order"""
+        try:
+            for n, entity_address in enumerate(addresses):
+                if self._prefetch_cancelled:
+                    break
+                self._blocks_ok[n] = self._read_entity_block(entity_address, self._blocks[n])
+                with self._blocks_ready:
+                    self._blocks_read = n + 1
+                    self._blocks_ready.notify()
+        finally:
+            # Release the main thread even if the job stopped early; unread blocks stay not-ok
+            with self._blocks_ready:
+                self._blocks_read = len(addresses)
+                self._blocks_ready.notify()
+
+    def _wait_for_block(self, n: int):
+        """Block until the worker has read entity n's field block"""
+        if self._blocks_read > n:  # Usually already there, no locking needed
+            return
+        with self._blocks_ready:
+            self._blocks_ready.wait_for(lambda: self._blocks_read > n)
+
+    def _read_pointer_table(self, base_address: int, slots: int = MAX_ENTITIES):
+        """Read the first `slots` entity pointer slots into self._pointer_table, in one call if possible"""
+        if _kernel32.ReadProcessMemory(self.pm.process_handle, base_address,
+                                       self._pointer_table,
+                                       slots * POINTER_SPACING, None):
+            return
+
+        # The end of the table may run into an unreadable page, which fails the whole read.
+        # Fall back to reading slot by slot, leaving unreadable slots empty.
+        ctypes.memset(self._pointer_table, 0, slots * POINTER_SPACING)
+        for i in range(slots):
+            entity_address = self._read_qword(base_address + i * POINTER_SPACING)
+            if not entity_address and i > 10:  # Same end-of-list rule as read_all_entities
+                break
+            self._pointer_table[i * POINTER_TABLE_STRIDE] = entity_address
+
+    def _read_list_header(self) -> int:
+        """
+        Read the entity list pointer together with the bytes around it, where the
+        entity count may live. Returns the list base address (0 on failure).
+        """
+        self._list_header_ok = bool(_kernel32.ReadProcessMemory(
+            self.pm.process_handle, self.entity_list_pointer - ENTITY_COUNT_PROBE_RANGE,
+            self._list_header, ctypes.sizeof(self._list_header), None))
+        if not self._list_header_ok:
+            return self._read_qword(self.entity_list_pointer)
+        return ctypes.c_uint64.from_buffer(self._list_header, ENTITY_COUNT_PROBE_RANGE).value
+
+    def _header_int(self, offset: int) -> int:
+        """int32 at `offset` from the list pointer, from the last _read_list_header"""
+        return ctypes.c_int32.from_buffer(self._list_header, ENTITY_COUNT_PROBE_RANGE + offset).value
+
+    def _read_entity_count(self) -> Optional[int]:
+        """Entity count from the list header, if its location has been found"""
+        if self._count_offset is None or not self._list_header_ok:
             return None
+        count = self._header_int(self._count_offset)
+        return count if 0 <= count <= MAX_ENTITIES else None
+
+    def _reject_entity_count(self, reason: str):
+        """Stop trusting the current count field and never consider its offset again"""
+        logging.info(f"Entity count field at list pointer {self._count_offset:+#x} {reason}, "
+                     f"scanning instead")
+        self._rejected_count_offsets.add(self._count_offset)
+        self._count_offset = None
+
+    def _probe_entity_count(self, slot_count: int):
+        """Look for an integer next to the entity list pointer that tracks the used slot count"""
+        if slot_count <= 0 or not self._list_header_ok:
+            return
+
+        for offset in range(-ENTITY_COUNT_PROBE_RANGE, ENTITY_COUNT_PROBE_RANGE + 1, 4):
+            if 0 <= offset < 8 or offset in self._rejected_count_offsets:  # 0..8 is the list pointer
+                continue
+            if self._header_int(offset) != slot_count:
+                self._count_matches.pop(offset, None)
+                continue
 
-    def _classify_entity(self, class_name: str, instance_name: str, health: float) -> EntityType:
+            # A constant that happens to equal a static count proves nothing, so the
+            # candidate also has to follow the count through at least one change
+            tracker = self._count_matches.setdefault(offset, [0, slot_count, 0])
+            if tracker[1] != slot_count:
+                tracker[2] += 1
+            tracker[0] += 1
+            tracker[1] = slot_count
+            if tracker[0] >= ENTITY_COUNT_CONFIRM_FRAMES and tracker[2] > 0:
+                self._count_offset = offset
+                self._count_matches.clear()
+                logging.info(f"Entity count field found at list pointer {offset:+#x}")
+                return
+
+    def _classify_entity(self, class_name: str, instance_name: str) -> EntityType:
         """
-        Determine entity type from its properties.
+        Determine entity type from its names.
         
         The Evil Within uses these class name patterns:
         - idPlayer: Player character
@@ -226,6 +425,9 @@ class GameMemoryReader:
         - idNpcEnemy: Hostile enemies
         - idNpcCorpse, idNpcAnimal_*: Neutral NPCs
         - Other: Static objects
+
+        Enemy classes always return ENEMY here; dead enemies are turned into
+        NPCs per frame by _apply_health, so the result can be cached by address.
         """
         class_lower = class_name.lower()
         instance_lower = instance_name.lower()
@@ -238,13 +440,9 @@ class GameMemoryReader:
         if "idpartner" in class_lower:
             return EntityType.PARTNER
         
-        # Check for enemies - but only if alive!
-        # Dead enemies (health <= 0) should show as NPC (yellow corpses)
+        # Check for enemies
         if "idnpcenemy" in class_lower or ("enemy" in class_lower):
-            if health and health > 0:
-                return EntityType.ENEMY
-            else:
-                return EntityType.NPC  # Dead enemies show as yellow
+            return EntityType.ENEMY
         
         # Check for neutral NPCs (corpses, animals, etc.)
         if "idnpc" in class_lower or "npc" in class_lower or "civilian" in class_lower:
@@ -253,87 +451,161 @@ class GameMemoryReader:
         # Everything else is an object
         return EntityType.OBJECT
 
-    def read_entity(self, base_address: int, index: int) -> Optional[Entity]:
-        """Read a single entity from memory"""
+    @staticmethod
+    def _apply_health(entity_type: EntityType, health: float) -> EntityType:
+        """Dead enemies (health <= 0) should show as NPC (yellow corpses)"""
+        if entity_type == EntityType.ENEMY and not (health and health > 0):
+            return EntityType.NPC
+        return entity_type
+
+    def read_entity(self, entity_address: int, block: EntityBlock) -> Optional[Entity]:
+        """Read a single entity from memory, given its already-read field block"""
         try:
-            pointer_address = base_address + (index * POINTER_SPACING)
-            entity_address = self.pm.read_longlong(pointer_address)
-
-            # Validate pointer
-            if not entity_address or entity_address < 0x10000:
-                return None
-
-            # Read all fields
-            fields = {}
-            for field_name, config in ENTITY_FIELD_CONFIG.items():
-                fields[field_name] = self._read_field(entity_address, config)
-
-            # Validate required fields
-            if fields["x"] is None or fields["y"] is None:
-                return None
-
-            # Create entity object
-            position = Position(
-                x=fields["x"],
-                y=fields["y"],
-                z=fields.get("z", 0.0) or 0.0
-            )
-
-            rotation = None
-            if fields["rot_c"] is not None and fields["rot_s"] is not None:
-                rotation = Rotation(
-                    cos_theta=fields["rot_c"],
-                    sin_theta=fields["rot_s"]
+            # Static objects that haven't moved are reused as-is (no string reads, no
+            # reclassification). Characters are always refreshed since their health and
+            # alertness change while standing still. Entities whose class name couldn't be
+            # read yet also default to OBJECT, so only confirmed classifications qualify.
+            cached = self._entity_cache.get(entity_address)
+            if (cached is not None and cached.entity_type == EntityType.OBJECT and
+                    entity_address in self._type_cache and
+                    cached.position.x == block.x and
+                    cached.position.y == block.y and
+                    cached.position.z == block.z):
+                return cached
+
+            health = block.health
+            alertness = block.alertness
+
+            # Class names never change for a given address, so the strings are only read
+            # and classified on first sight. Until the class name is readable nothing is
+            # cached, and the names are retried every frame (moving or not).
+            base_type = self._type_cache.get(entity_address)
+            if base_type is None:
+                class_name, instance_name = self._read_names(entity_address)
+                base_type = self._classify_entity(class_name, instance_name)
+                if class_name:
+                    self._type_cache[entity_address] = base_type
+            elif cached is not None:
+                class_name = cached.class_name
+                instance_name = cached.instance_name
+            else:
+                class_name = instance_name = ""
+            entity_type = self._apply_health(base_type, health)
+
+            # Entities seen last frame are updated in place rather than reallocated
+            if cached is not None:
+                entity = cached
+                entity.position.x = block.x
+                entity.position.y = block.y
+                entity.position.z = block.z
+                entity.rotation.cos_theta = block.rot_c
+                entity.rotation.sin_theta = block.rot_s
+                entity.entity_type = entity_type
+                entity.health = health
+                entity.class_name = class_name
+                entity.instance_name = instance_name
+                entity.alertness = alertness
+            else:
+                entity = Entity(
+                    address=entity_address,
+                    position=Position(x=block.x, y=block.y, z=block.z),
+                    entity_type=entity_type,
+                    health=health,
+                    class_name=class_name,
+                    instance_name=instance_name,
+                    rotation=Rotation(cos_theta=block.rot_c, sin_theta=block.rot_s),
+                    alertness=alertness
                 )
 
-            class_name = fields.get("class_name") or ""
-            instance_name = fields.get("instance_name") or ""
-            health = fields.get("health") or 0.0
-            alertness = fields.get("alertness")
-
-            entity_type = self._classify_entity(class_name, instance_name, health)
-
-            entity = Entity(
-                address=entity_address,
-                position=position,
-                entity_type=entity_type,
-                health=health,
-                class_name=class_name,
-                instance_name=instance_name,
-                rotation=rotation,
-                alertness=alertness
-            )
-
             return entity if entity.is_valid_position() else None
 
         except (pymem.exception.MemoryReadError, pymem.exception.WinAPIError):
             return None
         except Exception as e:
-            logging.debug(f"Error reading entity {index}: {e}")
+            logging.debug(f"Error reading entity 0x{entity_address:X}: {e}")
             return None
 
     def read_all_entities(self) -> List[Entity]:
         """Read all entities from the game"""
-        try:
-            base_address = self.pm.read_longlong(self.entity_list_pointer)
-            if not base_address:
-                return []
-        except Exception as e:
-            logging.debug(f"Failed to read entity list base: {e}")
+        base_address = self._read_list_header()
+        if not base_address:
+            logging.debug("Failed to read entity list base")
             return []
 
+        # With a known count only the used slots (plus one, to check the end) are read
+        slot_count = self._read_entity_count()
+        if slot_count is None:
+            self._read_pointer_table(base_address)
+        else:
+            self._read_pointer_table(base_address, min(slot_count + 1, MAX_ENTITIES))
+
+            # The last counted slot must be live and the one after it empty, otherwise
+            # the field isn't actually the count
+            if slot_count > 0 and self._pointer_table[(slot_count - 1) * POINTER_TABLE_STRIDE] < 0x10000:
+                self._reject_entity_count("overshoots the entity list")
+            elif (slot_count < MAX_ENTITIES and
+                    self._pointer_table[slot_count * POINTER_TABLE_STRIDE] >= 0x10000):
+                self._reject_entity_count("falls short of the entity list")
+            if self._count_offset is None:
+                slot_count = None
+                self._read_pointer_table(base_address)
+
+        candidates = []
+        if slot_count is not None:
+            for i in range(slot_count):
+                entity_address = self._pointer_table[i * POINTER_TABLE_STRIDE]
+                if entity_address and entity_address >= 0x10000:
+                    candidates.append((i, entity_address))
+        else:
+            # Collect valid entity pointers; the first invalid slot usually means end of list
+            for i in range(MAX_ENTITIES):
+                entity_address = self._pointer_table[i * POINTER_TABLE_STRIDE]
+                if entity_address and entity_address >= 0x10000:
+                    candidates.append((i, entity_address))
+                elif i > 10:  # Only break if we've read a reasonable number
+                    break
+            self._probe_entity_count(candidates[-1][0] + 1 if candidates else 0)
+
         entities = []
-        for i in range(MAX_ENTITIES):
-            entity = self.read_entity(base_address, i)
+        seen: Dict[int, Entity] = {}
+        pending: Optional[Future] = None
+        if candidates:
+            for n in range(len(candidates)):
+                self._blocks_ok[n] = False
+            self._blocks_read = 0
+            self._prefetch_cancelled = False
+            pending = self._prefetcher.submit(self._prefetch_blocks,
+                                              [entity_address for _, entity_address in candidates])
+
+        # One worker job reads all field blocks while entities are parsed here as they arrive
+        for n, (i, entity_address) in enumerate(candidates):
+            self._wait_for_block(n)
+            entity = self.read_entity(entity_address, self._blocks[n]) if self._blocks_ok[n] else None
             if entity is None:
-                # First None usually means end of list
-                if i > 10:  # Only break if we've read a reasonable number
+                if slot_count is None and i > 10:
                     break
                 continue
+            count = len(entities)
+            self.xs[count] = entity.position.x
+            self.ys[count] = entity.position.y
             entities.append(entity)
+            seen[entity.address] = entity
 
+        # Don't leave the worker writing into blocks that the next frame reuses
+        if pending is not None:
+            self._prefetch_cancelled = True
+            pending.result()
+
+        # Only keep entities that are still in the list
+        self._entity_cache = seen
+        self._type_cache = {address: self._type_cache[address]
+                            for address in seen if address in self._type_cache}
         return entities
 
+    def close(self):
+        """Stop the prefetch worker"""
+        self._prefetcher.shutdown(wait=True)
+
 
 # ============================================================================
 # RADAR DISPLAY
@@ -359,11 +631,32 @@ class RadarDisplay:
 
         self.center = (self.width // 2, self.height // 2)
 
+        # Pre-rendered enemy markers: one idle dot, and an alerted dot per alert ring pulse phase
+        self._enemy_sprite = self._make_enemy_sprite(COLORS["enemy"])
+        self._alert_sprites = [
+            self._make_enemy_sprite(COLORS["enemy_alerted"],
+                                    8 + int(phase / (ALERT_PULSE_PHASES - 1) * 4))  # Pulse from 8 to 12 pixels
+            for phase in range(ALERT_PULSE_PHASES)
+        ]
+
+        # Rendered info panel lines, keyed by text (see _text)
+        self._text_cache: Dict[str, pygame.Surface] = {}
+
+        # Grid and range rings only change with radar_range, so they are drawn once
+        # into this surface and blitted every frame (see draw_background)
+        self._bg_surface = pygame.Surface((self.width, self.height)).convert()
+        self._bg_dirty = True
+
     @property
     def scale(self) -> float:
         """Current pixels per game unit"""
         return self.width / (2 * self.radar_range)
 
+    @property
+    def visible_range(self) -> float:
+        """Game-unit distance from the center to the screen corners"""
+        return math.hypot(self.width, self.height) / (2 * self.scale)
+
     def handle_events(self) -> bool:
         """Handle pygame events. Returns False if should quit."""
         for event in pygame.event.get():
@@ -374,41 +667,52 @@ class RadarDisplay:
                     return False
                 elif event.key == pygame.K_MINUS or event.key == pygame.K_UNDERSCORE:
                     self.radar_range = min(self.max_range, self.radar_range + self.range_step)
+                    self._bg_dirty = True
                 elif event.key in (pygame.K_PLUS, pygame.K_EQUALS):
                     self.radar_range = max(self.min_range, self.radar_range - self.range_step)
+                    self._bg_dirty = True
         return True
 
+    @staticmethod
+    def _make_enemy_sprite(color: Tuple[int, int, int], ring_radius: int = 0) -> pygame.Surface:
+        """Render an enemy dot, optionally with an alert ring, centered in a transparent surface"""
+        size = 2 * (max(8, ring_radius) + 1)
+        center = (size // 2, size // 2)
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        if ring_radius:
+            pygame.draw.circle(sprite, COLORS["alert_ring"], center, ring_radius, 2)
+        pygame.draw.circle(sprite, color, center, 8)
+        return sprite.convert_alpha()
+
     def draw_background(self):
         """Draw radar background and grid"""
-        self.screen.fill(COLORS["background"])
+        if self._bg_dirty:
+            self._render_background()
+            self._bg_dirty = False
+        self.screen.blit(self._bg_surface, (0, 0))
+
+    def _render_background(self):
+        """Draw background, crosshair and range rings into the cached surface"""
+        surface = self._bg_surface
+        surface.fill(COLORS["background"])
 
         # Center crosshair
-        pygame.draw.line(self.screen, COLORS["grid"],
+        pygame.draw.line(surface, COLORS["grid"],
                          (self.center[0], 0), (self.center[0], self.height), 1)
-        pygame.draw.line(self.screen, COLORS["grid"],
+        pygame.draw.line(surface, COLORS["grid"],
                          (0, self.center[1]), (self.width, self.center[1]), 1)
 
         # Range circle
-        pygame.draw.circle(self.screen, COLORS["grid"],
+        pygame.draw.circle(surface, COLORS["grid"],
                            self.center, int(self.radar_range * self.scale), 5)
 
         # Additional range rings
         num_rings = 8  # Change this number
         for i in range(1, num_rings + 1):
             fraction = i / (num_rings + 1)
-            pygame.draw.circle(self.screen, COLORS["grid"],
+            pygame.draw.circle(surface, COLORS["grid"],
                                self.center, int(self.radar_range * self.scale * fraction), 1)
 
-    def world_to_screen(self, radar_x: float, radar_y: float) -> Tuple[int, int]:
-        """Convert radar coordinates to screen coordinates"""
-        screen_x = int(self.center[0] + radar_x * self.scale)
-        screen_y = int(self.center[1] + radar_y * self.scale)  # radar_y already accounts for up direction
-        return screen_x, screen_y
-
-    def is_on_screen(self, screen_x: int, screen_y: int) -> bool:
-        """Check if screen coordinates are visible"""
-        return 0 <= screen_x < self.width and 0 <= screen_y < self.height
-
     def draw_player(self, screen_x: int, screen_y: int):
         """Draw player triangle (facing up)"""
         size = 10
@@ -419,8 +723,8 @@ class RadarDisplay:
         ]
         pygame.draw.polygon(self.screen, COLORS["player"], points)
 
-    def draw_entity(self, entity: Entity, screen_x: int, screen_y: int, distance: float,
-                    player_rotation: Optional[Rotation] = None):
+    def draw_entity(self, entity: Entity, screen_x: int, screen_y: int, distance_sq: float,
+                    player_rotation: Optional[Rotation] = None, pulse: float = 0.0):
         """Draw an entity on the radar"""
         if entity.entity_type == EntityType.PLAYER:
             self.draw_player(screen_x, screen_y)
@@ -429,15 +733,13 @@ class RadarDisplay:
             is_alerted = entity.is_alerted()
             enemy_color = COLORS["enemy_alerted"] if is_alerted else COLORS["enemy"]
             
-            # Draw alert ring for alerted enemies (pulsing effect)
+            # Draw enemy circle, with the pulsing alert ring for alerted enemies
             if is_alerted:
-                import time
-                pulse = abs(math.sin(time.time() * 3))  # Pulse between 0 and 1
-                ring_radius = 8 + int(pulse * 4)  # Pulse from 8 to 12 pixels
-                pygame.draw.circle(self.screen, COLORS["alert_ring"], (screen_x, screen_y), ring_radius, 2)
-            
-            # Draw main enemy circle
-            pygame.draw.circle(self.screen, enemy_color, (screen_x, screen_y), 8)
+                sprite = self._alert_sprites[int(pulse * (ALERT_PULSE_PHASES - 1))]
+            else:
+                sprite = self._enemy_sprite
+            half = sprite.get_width() // 2
+            self.screen.blit(sprite, (screen_x - half, screen_y - half))
             
             # Draw health bar for enemies
             if entity.health > 0:
@@ -471,7 +773,8 @@ class RadarDisplay:
             pygame.draw.circle(self.screen, COLORS["object"], (screen_x, screen_y), 5)
 
         # Draw distance for non-player entities
-        if entity.entity_type != EntityType.PLAYER and distance > 10:
+        if entity.entity_type != EntityType.PLAYER and distance_sq > 100:
+            distance = math.sqrt(distance_sq)
             dist_text = self.font_small.render(f"{int(distance)}", True, COLORS["text"])
             self.screen.blit(dist_text, (screen_x + 10, screen_y - 5))
 
@@ -564,8 +867,18 @@ class RadarDisplay:
             info_lines.insert(2, f"Facing: {player_rotation.angle_degrees:6.1f}°")
 
         for i, line in enumerate(info_lines):
-            text = self.font.render(line, True, COLORS["text"])
-            self.screen.blit(text, (10, 10 + i * 22))
+            self.screen.blit(self._text(line), (10, 10 + i * 22))
+
+    def _text(self, line: str) -> pygame.Surface:
+        """Render an info panel line, reusing the surface if it was rendered before"""
+        surface = self._text_cache.get(line)
+        if surface is None:
+            # Dynamic lines (facing, counts) keep producing new strings, so keep the cache bounded
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self.font.render(line, True, COLORS["text"])
+            self._text_cache[line] = surface
+        return surface
 
     def flip(self):
         """Update display"""
@@ -577,6 +890,38 @@ class RadarDisplay:
         pygame.quit()
 
 
+# ============================================================================
+# RADAR PROJECTION
+# ============================================================================
+
+@njit(cache=True)
+def project_entities(xs, ys, count, player_x, player_y, a, b, c, d, ox, oy, cull_range,
+                     width, height, out_screen_xs, out_screen_ys, out_distances_sq, out_visible):
+    """
+    Project the first `count` entity positions onto the screen.
+
+    (a, b, c, d) is the combined radar transform and screen scale, and (ox, oy) the
+    screen center. Entities farther than cull_range along either axis are rejected
+    before any transform. out_visible marks the entities that land on screen.
+    """
+    for i in range(count):
+        rel_x = xs[i] - player_x
+        rel_y = ys[i] - player_y
+
+        # Cheap conservative cull: nothing farther than the screen corners along
+        # either axis can be on screen
+        if abs(rel_x) > cull_range or abs(rel_y) > cull_range:
+            out_visible[i] = False
+            continue
+
+        screen_x = int(ox + a * rel_x + b * rel_y)
+        screen_y = int(oy + c * rel_x + d * rel_y)
+        out_screen_xs[i] = screen_x
+        out_screen_ys[i] = screen_y
+        out_distances_sq[i] = rel_x * rel_x + rel_y * rel_y
+        out_visible[i] = 0 <= screen_x < width and 0 <= screen_y < height
+
+
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
@@ -586,6 +931,12 @@ class RadarApp:
         self.memory_reader = GameMemoryReader(GAME_EXE)
         self.display = RadarDisplay(RADAR_CONFIG)
 
+        # Per-frame output of project_entities, index-aligned with the entity list
+        self._screen_xs = np.empty(MAX_ENTITIES, dtype=np.int32)
+        self._screen_ys = np.empty(MAX_ENTITIES, dtype=np.int32)
+        self._distances_sq = np.empty(MAX_ENTITIES, dtype=np.float32)
+        self._visible = np.empty(MAX_ENTITIES, dtype=np.bool_)
+
     def run(self):
         """Main application loop"""
         running = True
@@ -611,22 +962,35 @@ class RadarApp:
                 self.display.draw_background()
 
                 if player and player.rotation:
-                    # Draw all entities relative to player
-                    for entity in entities:
-                        # Get world-space offset
-                        rel_x = entity.position.x - player.position.x
-                        rel_y = entity.position.y - player.position.y
-
-                        # Transform to radar space
-                        radar_x, radar_y = player.rotation.to_radar_space(rel_x, rel_y)
-
-                        # Convert to screen coordinates
-                        screen_x, screen_y = self.display.world_to_screen(radar_x, radar_y)
-
-                        # Draw if on screen
-                        if self.display.is_on_screen(screen_x, screen_y):
-                            distance = entity.position.distance_to(player.position)
-                            self.display.draw_entity(entity, screen_x, screen_y, distance, player.rotation)
+                    # Alert ring pulse between 0 and 1, shared by every enemy this frame
+                    pulse = abs(math.sin(pygame.time.get_ticks() * 0.003))
+
+                    # Radar transform (Rotation.to_radar_space) and screen scale folded
+                    # into one 2x2 matrix, computed once per frame
+                    scale = self.display.scale
+                    cos_theta = player.rotation.cos_theta
+                    sin_theta = player.rotation.sin_theta
+                    a = -sin_theta * scale
+                    b = -cos_theta * scale
+                    c = -cos_theta * scale
+                    d = sin_theta * scale
+                    ox, oy = self.display.center
+
+                    count = len(entities)
+                    project_entities(self.memory_reader.xs, self.memory_reader.ys, count,
+                                     player.position.x, player.position.y,
+                                     a, b, c, d, ox, oy, self.display.visible_range,
+                                     self.display.width, self.display.height,
+                                     self._screen_xs, self._screen_ys, self._distances_sq,
+                                     self._visible)
+
+                    # Drawing stays per entity, for the ones that ended up on screen
+                    for index in np.flatnonzero(self._visible[:count]).tolist():
+                        self.display.draw_entity(entities[index],
+                                                 int(self._screen_xs[index]),
+                                                 int(self._screen_ys[index]),
+                                                 float(self._distances_sq[index]),
+                                                 player.rotation, pulse)
 
                 # Draw UI
                 if self.display.show_info_panel:
@@ -646,6 +1010,7 @@ class RadarApp:
         except Exception as e:
             logging.error(f"Unexpected error: {e}", exc_info=True)
         finally:
+            self.memory_reader.close()
             self.display.quit()
 
 